@@ -180,7 +180,7 @@ impl RustTraitDetector {
     /// Handles both simple names and qualified paths
     fn match_standard_trait(&self, trait_name: &str) -> Option<StandardTrait> {
         // Extract final segment for matching
-        let simple_name = trait_name.split("::").last()?;
+        let simple_name = trait_name.rsplit("::").next()?;
 
         match simple_name {
             "Display" => Some(StandardTrait::Display),
@@ -99,10 +99,10 @@ pub fn save_checkpoint(state: &AnalysisState, path: &Path) -> Result<()> {
 /// Returns a state that can be used to resume analysis. Note that
 /// computed results (call_graph, coverage, etc.) will need to be recomputed.
 pub fn load_checkpoint(path: &Path) -> Result<AnalysisState> {
-    let json = std::fs::read_to_string(path).context("Failed to read checkpoint file")?;
+    let json = std::fs::read(path).context("Failed to read checkpoint file")?;
 
     let checkpoint: Checkpoint =
-        serde_json::from_str(&json).context("Failed to parse checkpoint JSON")?;
+        serde_json::from_slice(&json).context("Failed to parse checkpoint JSON")?;
 
     // Validate version
     if checkpoint.version > Checkpoint::CURRENT_VERSION {
@@ -79,7 +79,7 @@ impl<'a> CallResolver<'a> {
             function_index.entry(key).or_default().push(func_id.clone());
 
             // Also index by just the function name without qualification
-            if let Some(simple_name) = func_id.name.split("::").last()
+            if let Some(simple_name) = func_id.name.rsplit("::").next()
                 && simple_name != func_id.name
             {
                 function_index
@@ -144,7 +144,7 @@ impl<'a> CallResolver<'a> {
         // Fast O(1) lookup instead of O(n) linear search
         let candidates = self.function_index.get(&normalized_name).or_else(|| {
             // Try looking up by simple name if qualified lookup fails
-            if let Some(simple_name) = call.callee_name.split("::").last() {
+            if let Some(simple_name) = call.callee_name.rsplit("::").next() {
                 self.function_index.get(simple_name)
             } else {
                 None
@@ -49,7 +49,7 @@ impl PathResolver {
                 .push(func.clone());
 
             // Index by simple name (last component)
-            if let Some(simple_name) = func.name.split("::").last() {
+            if let Some(simple_name) = func.name.rsplit("::").next() {
                 index
                     .entry(simple_name.to_string())
                     .or_default()
@@ -187,7 +187,7 @@ impl PathResolver {
         let normalized_name = CallResolver::strip_generic_params(callee_name);
 
         // Try simple name lookup with fuzzy matching
-        if let Some(simple_name) = normalized_name.split("::").last()
+        if let Some(simple_name) = normalized_name.rsplit("::").next()
             && let Some(candidates) = self.function_index.get(simple_name)
         {
             for func in candidates {
@@ -341,7 +341,7 @@ impl PathResolver {
         }
 
         // Try matching by simple name and filtering
-        if let Some(base_name) = path.split("::").last()
+        if let Some(base_name) = path.rsplit("::").next()
             && let Some(candidates) = self.function_index.get(base_name)
         {
             // Filter candidates that match the full path
@@ -363,7 +363,7 @@ impl PathResolver {
         }
 
         // Base name match (Type::method matches method)
-        if let Some(base) = full_name.split("::").last()
+        if let Some(base) = full_name.rsplit("::").next()
             && base == search_name
         {
             return true;
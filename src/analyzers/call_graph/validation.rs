@@ -4,7 +4,7 @@
 /// orphaned nodes, and suspicious patterns in the call graph.
 use crate::priority::call_graph::{CallGraph, FunctionId};
 use std::collections::{HashMap, HashSet};
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 
 /// Configuration for call graph validation
 #[derive(Debug, Clone, Default)]
@@ -404,14 +404,15 @@ impl CallGraphValidator {
 
     /// Check for duplicate nodes (same function registered multiple times)
     fn check_duplicate_nodes(call_graph: &CallGraph, report: &mut ValidationReport) {
-        let mut function_counts: HashMap<String, Vec<FunctionId>> = HashMap::new();
+        // Keyed on borrowed (file, name) pairs: no per-function key string
+        // is formatted and no FunctionId is cloned until a duplicate is found.
+        let mut function_counts: HashMap<(&Path, &str), Vec<&FunctionId>> = HashMap::new();
 
         for function in call_graph.get_all_functions() {
-            let key = format!("{}:{}", function.file.display(), function.name);
             function_counts
-                .entry(key)
+                .entry((function.file.as_path(), function.name.as_str()))
                 .or_default()
-                .push(function.clone());
+                .push(function);
         }
 
         for (_, functions) in function_counts {
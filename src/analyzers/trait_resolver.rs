@@ -266,7 +266,7 @@ impl TraitResolver {
     /// Check if a type satisfies a trait bound
     fn type_satisfies_bound(&self, type_name: &str, bound: &str) -> bool {
         // Extract trait name from bound (simplified)
-        let trait_name = bound.split("::").last().unwrap_or(bound);
+        let trait_name = bound.rsplit("::").next().unwrap_or(bound);
         self.tracker.implements_trait(type_name, trait_name)
     }
 
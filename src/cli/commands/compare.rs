@@ -6,8 +6,11 @@
 use crate::cli::args::OutputFormat;
 use crate::commands::compare_debtmap::DebtmapJsonInput;
 use crate::comparison::{Comparator, ComparisonResult, DebtTrend, PlanParser, TargetStatus};
+use crate::io::{buffered_stdout, create_buffered_file};
 use crate::priority::UnifiedAnalysis;
 use anyhow::Result;
+use std::fmt::Write;
+use std::io::{self, Write as _};
 use std::path::Path;
 
 /// Resolve the target item location from a plan file or explicit CLI argument.
@@ -21,32 +24,55 @@ fn resolve_compare_target(
 }
 
 /// Load a debtmap JSON analysis file and convert it to [`UnifiedAnalysis`].
+///
+/// The raw file bytes are dropped as soon as they are parsed, so they are
+/// not held alongside the parsed items while those are converted.
 fn load_analysis_from_path(path: &Path) -> Result<UnifiedAnalysis> {
-    let content = std::fs::read_to_string(path)?;
-    let json: DebtmapJsonInput = serde_json::from_str(&content)?;
+    let json: DebtmapJsonInput = {
+        let content = std::fs::read(path)?;
+        serde_json::from_slice(&content)?
+    };
     Ok(json_to_analysis(json))
 }
 
-/// Serialize a comparison result for JSON or Markdown output.
-fn serialize_comparison(comparison: &ComparisonResult, format: OutputFormat) -> Result<String> {
+/// Serialize a comparison result for JSON or Markdown output into `writer`.
+fn serialize_comparison(
+    comparison: &ComparisonResult,
+    format: OutputFormat,
+    writer: &mut impl io::Write,
+) -> Result<()> {
     match format {
-        OutputFormat::Json => Ok(serde_json::to_string_pretty(comparison)?),
-        OutputFormat::Markdown => Ok(format_comparison_markdown(comparison)),
+        OutputFormat::Json => serde_json::to_writer_pretty(writer, comparison)?,
+        OutputFormat::Markdown => {
+            writer.write_all(format_comparison_markdown(comparison).as_bytes())?
+        }
         OutputFormat::Dot | OutputFormat::Terminal => {
             anyhow::bail!("terminal formats use print_comparison_terminal")
         }
     }
+    Ok(())
 }
 
 /// Write serialized output to a file or stdout.
-fn write_or_print(content: &str, output: Option<&Path>) -> Result<()> {
+fn write_or_print(
+    comparison: &ComparisonResult,
+    format: OutputFormat,
+    output: Option<&Path>,
+) -> Result<()> {
     match output {
-        Some(path) => std::fs::write(path, content).map_err(Into::into),
+        Some(path) => {
+            let mut writer = create_buffered_file(path)?;
+            serialize_comparison(comparison, format, &mut writer)?;
+            writer.flush()?;
+        }
         None => {
-            println!("{content}");
-            Ok(())
+            let mut writer = buffered_stdout();
+            serialize_comparison(comparison, format, &mut writer)?;
+            writer.write_all(b"\n")?;
+            writer.flush()?;
         }
     }
+    Ok(())
 }
 
 /// Emit comparison results in the requested format.
@@ -59,8 +85,7 @@ fn write_comparison_output(
         print_comparison_terminal(comparison);
         return Ok(());
     }
-    let output_str = serialize_comparison(comparison, format)?;
-    write_or_print(&output_str, output)
+    write_or_print(comparison, format, output)
 }
 
 /// Handle the compare command
@@ -73,8 +98,11 @@ pub fn handle_compare_command(
     output: Option<&Path>,
 ) -> Result<()> {
     let target = resolve_compare_target(plan, target_location)?;
-    let before_results = load_analysis_from_path(before)?;
-    let after_results = load_analysis_from_path(after)?;
+    let (before_results, after_results) = rayon::join(
+        || load_analysis_from_path(before),
+        || load_analysis_from_path(after),
+    );
+    let (before_results, after_results) = (before_results?, after_results?);
     let comparison = Comparator::new(before_results, after_results, target).compare()?;
     write_comparison_output(&comparison, format, output)
 }
@@ -93,10 +121,10 @@ fn json_to_analysis(json: DebtmapJsonInput) -> UnifiedAnalysis {
     for item in json.items {
         match item {
             UnifiedDebtItemOutput::Function(func) => {
-                items.push_back(output_to_internal_function(&func));
+                items.push_back(output_to_internal_function(*func));
             }
             UnifiedDebtItemOutput::File(file) => {
-                file_items.push_back(output_to_internal_file(&file));
+                file_items.push_back(output_to_internal_file(*file));
             }
         }
     }
@@ -121,8 +149,11 @@ fn json_to_analysis(json: DebtmapJsonInput) -> UnifiedAnalysis {
 }
 
 /// Convert FunctionDebtItemOutput to UnifiedDebtItem with minimal fields for comparison
+///
+/// Takes the item by value so its strings and line lists move across
+/// instead of being cloned per item.
 fn output_to_internal_function(
-    output: &crate::output::unified::FunctionDebtItemOutput,
+    output: crate::output::unified::FunctionDebtItemOutput,
 ) -> crate::priority::unified_scorer::UnifiedDebtItem {
     use crate::priority::unified_scorer::{Location, UnifiedDebtItem, UnifiedScore};
     use crate::priority::{ActionableRecommendation, ImpactMetrics};
@@ -130,11 +161,11 @@ fn output_to_internal_function(
 
     UnifiedDebtItem {
         location: Location {
-            file: PathBuf::from(&output.location.file),
-            function: output.location.function.clone().unwrap_or_default(),
+            file: PathBuf::from(output.location.file),
+            function: output.location.function.unwrap_or_default(),
             line: output.location.line.unwrap_or(0),
         },
-        debt_type: output.debt_type.clone(),
+        debt_type: output.debt_type,
         unified_score: UnifiedScore {
             complexity_factor: 0.0,
             coverage_factor: 0.0,
@@ -177,7 +208,7 @@ fn output_to_internal_function(
                 direct: cov,
                 transitive: cov,
                 propagated_from: vec![],
-                uncovered_lines: output.metrics.uncovered_lines.clone().unwrap_or_default(),
+                uncovered_lines: output.metrics.uncovered_lines.unwrap_or_default(),
             }
         }),
         upstream_dependencies: output.dependencies.upstream_count,
@@ -217,14 +248,14 @@ fn output_to_internal_function(
 
 /// Convert FileDebtItemOutput to FileDebtItem with minimal fields for comparison
 fn output_to_internal_file(
-    output: &crate::output::unified::FileDebtItemOutput,
+    output: crate::output::unified::FileDebtItemOutput,
 ) -> crate::priority::file_metrics::FileDebtItem {
     use crate::priority::file_metrics::{FileDebtItem, FileDebtMetrics, FileImpact};
     use std::path::PathBuf;
 
     FileDebtItem {
         metrics: FileDebtMetrics {
-            path: PathBuf::from(&output.location.file),
+            path: PathBuf::from(output.location.file),
             total_lines: output.metrics.lines,
             function_count: output.metrics.functions,
             class_count: output.metrics.classes,
@@ -264,10 +295,7 @@ fn format_comparison_markdown(comparison: &ComparisonResult) -> String {
     let mut md = String::new();
 
     md.push_str("# Debtmap Comparison Report\n\n");
-    md.push_str(&format!(
-        "**Date**: {}\n\n",
-        comparison.metadata.comparison_date
-    ));
+    writeln!(md, "**Date**: {}\n", comparison.metadata.comparison_date).unwrap();
 
     if let Some(target) = &comparison.target_item {
         md.push_str("## Target Item Analysis\n\n");
@@ -280,51 +308,62 @@ fn format_comparison_markdown(comparison: &ComparisonResult) -> String {
             TargetStatus::NotFoundBefore | TargetStatus::NotFound => "[UNKNOWN]",
         };
 
-        md.push_str(&format!(
-            "{} **Status**: {:?}\n\n",
-            status_icon, target.status
-        ));
-        md.push_str(&format!("**Location**: `{}`\n\n", target.location));
+        writeln!(md, "{} **Status**: {:?}\n", status_icon, target.status).unwrap();
+        writeln!(md, "**Location**: `{}`\n", target.location).unwrap();
 
         md.push_str("### Before\n");
-        md.push_str(&format!("- **Score**: {:.1}\n", target.before.score));
-        md.push_str(&format!(
-            "- **Complexity**: Cyclomatic {}, Cognitive {}\n",
+        writeln!(md, "- **Score**: {:.1}", target.before.score).unwrap();
+        writeln!(
+            md,
+            "- **Complexity**: Cyclomatic {}, Cognitive {}",
             target.before.cyclomatic_complexity, target.before.cognitive_complexity
-        ));
-        md.push_str(&format!("- **Coverage**: {:.1}%\n", target.before.coverage));
-        md.push_str(&format!(
-            "- **Function Length**: {} lines\n\n",
+        )
+        .unwrap();
+        writeln!(md, "- **Coverage**: {:.1}%", target.before.coverage).unwrap();
+        writeln!(
+            md,
+            "- **Function Length**: {} lines\n",
             target.before.function_length
-        ));
+        )
+        .unwrap();
 
         if let Some(after_metrics) = &target.after {
             md.push_str("### After\n");
-            md.push_str(&format!("- **Score**: {:.1}\n", after_metrics.score));
-            md.push_str(&format!(
-                "- **Complexity**: Cyclomatic {}, Cognitive {}\n",
+            writeln!(md, "- **Score**: {:.1}", after_metrics.score).unwrap();
+            writeln!(
+                md,
+                "- **Complexity**: Cyclomatic {}, Cognitive {}",
                 after_metrics.cyclomatic_complexity, after_metrics.cognitive_complexity
-            ));
-            md.push_str(&format!("- **Coverage**: {:.1}%\n", after_metrics.coverage));
-            md.push_str(&format!(
-                "- **Function Length**: {} lines\n\n",
+            )
+            .unwrap();
+            writeln!(md, "- **Coverage**: {:.1}%", after_metrics.coverage).unwrap();
+            writeln!(
+                md,
+                "- **Function Length**: {} lines\n",
                 after_metrics.function_length
-            ));
+            )
+            .unwrap();
         }
 
         md.push_str("### Improvements\n");
-        md.push_str(&format!(
-            "- Score reduced by **{:.1}%**\n",
+        writeln!(
+            md,
+            "- Score reduced by **{:.1}%**",
             target.improvements.score_reduction_pct
-        ));
-        md.push_str(&format!(
-            "- Complexity reduced by **{:.1}%**\n",
+        )
+        .unwrap();
+        writeln!(
+            md,
+            "- Complexity reduced by **{:.1}%**",
             target.improvements.complexity_reduction_pct
-        ));
-        md.push_str(&format!(
-            "- Coverage improved by **{:.1}%**\n\n",
+        )
+        .unwrap();
+        writeln!(
+            md,
+            "- Coverage improved by **{:.1}%**\n",
             target.improvements.coverage_improvement_pct
-        ));
+        )
+        .unwrap();
     }
 
     md.push_str("## Project Health\n\n");
@@ -335,32 +374,40 @@ fn format_comparison_markdown(comparison: &ComparisonResult) -> String {
         DebtTrend::Regressing => "[REGRESSING]",
     };
 
-    md.push_str(&format!(
-        "### Overall Trend: {} {:?}\n\n",
+    writeln!(
+        md,
+        "### Overall Trend: {} {:?}\n",
         trend_icon, comparison.summary.overall_debt_trend
-    ));
-    md.push_str(&format!(
-        "- Total debt: {:.1} -> {:.1} ({:+.1}%)\n",
+    )
+    .unwrap();
+    writeln!(
+        md,
+        "- Total debt: {:.1} -> {:.1} ({:+.1}%)",
         comparison.project_health.before.total_debt_score,
         comparison.project_health.after.total_debt_score,
         comparison.project_health.changes.debt_score_change_pct
-    ));
-    md.push_str(&format!(
-        "- Critical items: {} -> {} ({:+})\n",
+    )
+    .unwrap();
+    writeln!(
+        md,
+        "- Critical items: {} -> {} ({:+})",
         comparison.project_health.before.critical_items,
         comparison.project_health.after.critical_items,
         comparison.project_health.changes.critical_items_change
-    ));
+    )
+    .unwrap();
 
     if !comparison.regressions.is_empty() {
-        md.push_str(&format!(
-            "\n[WARNING] {} new critical item(s) detected\n\n",
+        writeln!(
+            md,
+            "\n[WARNING] {} new critical item(s) detected\n",
             comparison.regressions.len()
-        ));
+        )
+        .unwrap();
 
         md.push_str("### Regressions\n\n");
         for reg in &comparison.regressions {
-            md.push_str(&format!("- `{}` (score: {:.1})\n", reg.location, reg.score));
+            writeln!(md, "- `{}` (score: {:.1})", reg.location, reg.score).unwrap();
         }
     } else {
         md.push_str("\n[OK] No new critical items introduced\n");
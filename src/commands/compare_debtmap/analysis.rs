@@ -4,12 +4,12 @@
 //! from inputs without side effects. Functions are kept under 20 lines.
 
 use super::types::{
-    AnalysisSummary, DebtmapJsonInput, IdentifiedChanges, ImprovedItems, ItemInfo, NewItems,
-    ResolvedItems, UnchangedCritical, extract_function_keys, extract_functions,
-    extract_location_keys, is_critical, is_score_unchanged, is_significantly_improved,
+    AnalysisSummary, DebtmapJsonInput, FunctionKey, IdentifiedChanges, ImprovedItems, ItemInfo,
+    NewItems, ResolvedItems, UnchangedCritical, extract_function_keys, extract_functions,
+    function_key, is_critical, is_score_unchanged, is_significantly_improved,
 };
 use crate::output::unified::{FunctionDebtItemOutput, UnifiedDebtItemOutput};
-use std::collections::{HashMap, HashSet};
+use std::collections::HashMap;
 use std::path::PathBuf;
 
 // =============================================================================
@@ -17,45 +17,90 @@ use std::path::PathBuf;
 // =============================================================================
 
 /// Pure: Create summary from function items
+///
+/// Counts, critical items and the score sum are gathered in one pass over
+/// the items, without collecting the scores first.
 pub fn create_summary(analysis: &DebtmapJsonInput) -> AnalysisSummary {
-    let function_items: Vec<_> = extract_functions(&analysis.items).collect();
-    let scores: Vec<f64> = function_items.iter().map(|f| f.score).collect();
+    let (total_items, high_priority_items, score_sum) = extract_functions(&analysis.items).fold(
+        (0usize, 0usize, 0.0f64),
+        |(total, critical, sum), f| {
+            (
+                total + 1,
+                critical + usize::from(is_critical(f.score)),
+                sum + f.score,
+            )
+        },
+    );
 
     AnalysisSummary {
-        total_items: function_items.len(),
-        high_priority_items: count_critical_items(&scores),
-        average_score: calculate_average(&scores),
+        total_items,
+        high_priority_items,
+        average_score: calculate_average(score_sum, total_items),
     }
 }
 
-/// Pure: Count items with critical scores
-fn count_critical_items(scores: &[f64]) -> usize {
-    scores.iter().filter(|&&s| is_critical(s)).count()
-}
-
-/// Pure: Calculate average of scores
-fn calculate_average(scores: &[f64]) -> f64 {
-    if scores.is_empty() {
-        0.0
-    } else {
-        scores.iter().sum::<f64>() / scores.len() as f64
-    }
+/// Pure: Calculate average from a score sum and item count
+fn calculate_average(sum: f64, count: usize) -> f64 {
+    if count == 0 { 0.0 } else { sum / count as f64 }
 }
 
 // =============================================================================
 // Change Identification
 // =============================================================================
 
+/// Lookup from (file, function) key to the function item it names
+type FunctionIndex<'a> = HashMap<FunctionKey<'a>, &'a FunctionDebtItemOutput>;
+
+/// Pure: Index a debtmap's function items by (file, function)
+fn build_function_index(analysis: &DebtmapJsonInput) -> FunctionIndex<'_> {
+    extract_function_keys(&analysis.items).collect()
+}
+
+/// One side's function items, split by presence of their key on the other side
+#[derive(Default)]
+struct KeyPartition<'a> {
+    /// Items whose key also exists on the other side, paired with that entry
+    common: Vec<(&'a FunctionDebtItemOutput, &'a FunctionDebtItemOutput)>,
+    /// Items whose key is missing from the other side
+    only: Vec<&'a FunctionDebtItemOutput>,
+}
+
+/// Pure: Split items into those shared with `other` and those unique to them
+///
+/// Every item is looked up in `other` exactly once; the identifiers below
+/// then walk only the half of the partition they care about.
+fn partition_by_key<'a>(
+    items: &'a [UnifiedDebtItemOutput],
+    other: &FunctionIndex<'a>,
+) -> KeyPartition<'a> {
+    extract_functions(items).fold(KeyPartition::default(), |mut partition, item| {
+        match other.get(&function_key(item)) {
+            Some(&counterpart) => partition.common.push((item, counterpart)),
+            None => partition.only.push(item),
+        }
+        partition
+    })
+}
+
 /// Pure: Identify all changes between before and after debtmaps
+///
+/// Each side is indexed and partitioned against the other once: resolved and
+/// new items come from the one-sided halves, improved and unchanged critical
+/// items from the shared halves, so no key is probed twice.
 pub fn identify_all_changes(
     before: &DebtmapJsonInput,
     after: &DebtmapJsonInput,
 ) -> IdentifiedChanges {
+    let before_index = build_function_index(before);
+    let after_index = build_function_index(after);
+    let before_side = partition_by_key(&before.items, &after_index);
+    let after_side = partition_by_key(&after.items, &before_index);
+
     IdentifiedChanges {
-        resolved: identify_resolved_items(before, after),
-        improved: identify_improved_items(before, after),
-        new_items: identify_new_items(before, after),
-        unchanged_critical: identify_unchanged_critical(before, after),
+        resolved: resolved_against(&before_side),
+        improved: improved_against(&after_side),
+        new_items: new_against(&after_side),
+        unchanged_critical: unchanged_critical_against(&before_side),
     }
 }
 
@@ -68,36 +113,24 @@ pub fn identify_resolved_items(
     before: &DebtmapJsonInput,
     after: &DebtmapJsonInput,
 ) -> ResolvedItems {
-    let after_keys: HashSet<_> = extract_location_keys(&after.items).collect();
-    let resolved = find_removed_functions(&before.items, &after_keys);
+    resolved_against(&partition_by_key(
+        &before.items,
+        &build_function_index(after),
+    ))
+}
 
+/// Pure: Count before items that have no after entry
+fn resolved_against(before_side: &KeyPartition<'_>) -> ResolvedItems {
     ResolvedItems {
-        high_priority_count: count_high_priority(&resolved),
-        total_count: resolved.len(),
+        high_priority_count: before_side
+            .only
+            .iter()
+            .filter(|item| is_critical(item.score))
+            .count(),
+        total_count: before_side.only.len(),
     }
 }
 
-/// Pure: Find functions that exist in items but not in keys set
-fn find_removed_functions<'a>(
-    items: &'a [UnifiedDebtItemOutput],
-    existing_keys: &HashSet<(PathBuf, String)>,
-) -> Vec<&'a FunctionDebtItemOutput> {
-    extract_functions(items)
-        .filter(|f| {
-            let key = (
-                PathBuf::from(&f.location.file),
-                f.location.function.clone().unwrap_or_default(),
-            );
-            !existing_keys.contains(&key)
-        })
-        .collect()
-}
-
-/// Pure: Count high priority items in resolved list
-fn count_high_priority(items: &[&FunctionDebtItemOutput]) -> usize {
-    items.iter().filter(|item| is_critical(item.score)).count()
-}
-
 // =============================================================================
 // Improved Items Analysis
 // =============================================================================
@@ -107,10 +140,20 @@ pub fn identify_improved_items(
     before: &DebtmapJsonInput,
     after: &DebtmapJsonInput,
 ) -> ImprovedItems {
-    let before_map: HashMap<_, _> = extract_function_keys(&before.items).collect();
-    let improvements = collect_improvements(&after.items, &before_map);
+    improved_against(&partition_by_key(
+        &after.items,
+        &build_function_index(before),
+    ))
+}
 
-    aggregate_improvements(improvements)
+/// Pure: Aggregate improvements of after items over their before entries
+fn improved_against(after_side: &KeyPartition<'_>) -> ImprovedItems {
+    aggregate_improvements(
+        after_side
+            .common
+            .iter()
+            .filter_map(|&(after, before)| compute_improvement_if_significant(before, after)),
+    )
 }
 
 /// Single item improvement metrics
@@ -119,24 +162,6 @@ struct ImprovementMetrics {
     has_coverage_improvement: bool,
 }
 
-/// Pure: Collect improvement metrics for each improved item
-fn collect_improvements(
-    after_items: &[UnifiedDebtItemOutput],
-    before_map: &HashMap<(PathBuf, String), &FunctionDebtItemOutput>,
-) -> Vec<ImprovementMetrics> {
-    extract_functions(after_items)
-        .filter_map(|after| {
-            let key = (
-                PathBuf::from(&after.location.file),
-                after.location.function.clone().unwrap_or_default(),
-            );
-            before_map
-                .get(&key)
-                .and_then(|before| compute_improvement_if_significant(before, after))
-        })
-        .collect()
-}
-
 /// Pure: Compute improvement metrics if the improvement is significant
 fn compute_improvement_if_significant(
     before: &FunctionDebtItemOutput,
@@ -177,9 +202,20 @@ fn has_coverage_improved(before: &FunctionDebtItemOutput, after: &FunctionDebtIt
     after_cov > before_cov
 }
 
-/// Pure: Aggregate individual improvements into summary
-fn aggregate_improvements(improvements: Vec<ImprovementMetrics>) -> ImprovedItems {
-    if improvements.is_empty() {
+/// Pure: Aggregate individual improvements into summary in a single pass
+fn aggregate_improvements(improvements: impl Iterator<Item = ImprovementMetrics>) -> ImprovedItems {
+    let (count, total_reduction, coverage_count) = improvements.fold(
+        (0usize, 0.0f64, 0usize),
+        |(count, reduction, coverage), i| {
+            (
+                count + 1,
+                reduction + i.complexity_reduction,
+                coverage + usize::from(i.has_coverage_improvement),
+            )
+        },
+    );
+
+    if count == 0 {
         return ImprovedItems {
             complexity_reduction: 0.0,
             coverage_improvement: 0.0,
@@ -187,14 +223,8 @@ fn aggregate_improvements(improvements: Vec<ImprovementMetrics>) -> ImprovedItem
         };
     }
 
-    let total_reduction: f64 = improvements.iter().map(|i| i.complexity_reduction).sum();
-    let coverage_count = improvements
-        .iter()
-        .filter(|i| i.has_coverage_improvement)
-        .count();
-
     ImprovedItems {
-        complexity_reduction: total_reduction / improvements.len() as f64,
+        complexity_reduction: total_reduction / count as f64,
         coverage_improvement: coverage_count as f64,
         coverage_improvement_count: coverage_count,
     }
@@ -206,31 +236,25 @@ fn aggregate_improvements(improvements: Vec<ImprovementMetrics>) -> ImprovedItem
 
 /// Pure: Identify new critical items introduced in after
 pub fn identify_new_items(before: &DebtmapJsonInput, after: &DebtmapJsonInput) -> NewItems {
-    let before_keys: HashSet<_> = extract_location_keys(&before.items).collect();
-    let new_items = find_new_critical_items(&after.items, &before_keys);
-
-    NewItems {
-        critical_count: new_items.len(),
-        items: new_items,
-    }
+    new_against(&partition_by_key(
+        &after.items,
+        &build_function_index(before),
+    ))
 }
 
-/// Pure: Find new critical items not in before
-fn find_new_critical_items(
-    after_items: &[UnifiedDebtItemOutput],
-    before_keys: &HashSet<(PathBuf, String)>,
-) -> Vec<ItemInfo> {
-    extract_functions(after_items)
-        .filter(|f| {
-            let key = (
-                PathBuf::from(&f.location.file),
-                f.location.function.clone().unwrap_or_default(),
-            );
-            !before_keys.contains(&key)
-        })
+/// Pure: Collect critical after items that have no before entry
+fn new_against(after_side: &KeyPartition<'_>) -> NewItems {
+    let items: Vec<ItemInfo> = after_side
+        .only
+        .iter()
         .filter(|f| is_critical(f.score))
-        .map(function_to_item_info)
-        .collect()
+        .map(|f| function_to_item_info(f))
+        .collect();
+
+    NewItems {
+        critical_count: items.len(),
+        items,
+    }
 }
 
 /// Pure: Convert FunctionDebtItemOutput to ItemInfo
@@ -252,8 +276,19 @@ pub fn identify_unchanged_critical(
     before: &DebtmapJsonInput,
     after: &DebtmapJsonInput,
 ) -> UnchangedCritical {
-    let after_map: HashMap<_, _> = extract_function_keys(&after.items).collect();
-    let items = find_unchanged_critical(&before.items, &after_map);
+    unchanged_critical_against(&partition_by_key(
+        &before.items,
+        &build_function_index(after),
+    ))
+}
+
+/// Pure: Collect critical before items whose after entry kept its score
+fn unchanged_critical_against(before_side: &KeyPartition<'_>) -> UnchangedCritical {
+    let items: Vec<ItemInfo> = before_side
+        .common
+        .iter()
+        .filter_map(|&(before, after)| check_if_unchanged(before, after))
+        .collect();
 
     UnchangedCritical {
         count: items.len(),
@@ -261,36 +296,15 @@ pub fn identify_unchanged_critical(
     }
 }
 
-/// Pure: Find critical items that remained unchanged
-fn find_unchanged_critical(
-    before_items: &[UnifiedDebtItemOutput],
-    after_map: &HashMap<(PathBuf, String), &FunctionDebtItemOutput>,
-) -> Vec<ItemInfo> {
-    extract_functions(before_items)
-        .filter(|before| is_critical(before.score))
-        .filter_map(|before| check_if_unchanged(before, after_map))
-        .collect()
-}
-
 /// Pure: Check if a critical item remained unchanged in after
 fn check_if_unchanged(
     before: &FunctionDebtItemOutput,
-    after_map: &HashMap<(PathBuf, String), &FunctionDebtItemOutput>,
+    after: &FunctionDebtItemOutput,
 ) -> Option<ItemInfo> {
-    let key = (
-        PathBuf::from(&before.location.file),
-        before.location.function.clone().unwrap_or_default(),
-    );
-    let before_score = before.score;
-
-    after_map.get(&key).and_then(|after| {
-        let after_score = after.score;
-        if is_score_unchanged(before_score, after_score) && is_critical(after_score) {
-            Some(function_to_item_info(before))
-        } else {
-            None
-        }
-    })
+    let unchanged = is_critical(before.score)
+        && is_score_unchanged(before.score, after.score)
+        && is_critical(after.score);
+    unchanged.then(|| function_to_item_info(before))
 }
 
 // =============================================================================
@@ -300,8 +314,6 @@ fn check_if_unchanged(
 /// Build a map of (file, function) -> FunctionDebtItemOutput for quick lookup.
 /// Used primarily in tests.
 #[cfg(test)]
-pub fn build_function_map(
-    items: &[UnifiedDebtItemOutput],
-) -> HashMap<(PathBuf, String), &FunctionDebtItemOutput> {
+pub fn build_function_map(items: &[UnifiedDebtItemOutput]) -> FunctionIndex<'_> {
     extract_function_keys(items).collect()
 }
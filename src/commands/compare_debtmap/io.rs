@@ -1,44 +1,39 @@
 //! I/O operations for debtmap comparison.
 //!
 //! This module contains all side-effecting operations: file reading,
-//! writing, environment variable access, and console output.
+//! writing, and console output.
 
 use super::types::{CompareConfig, DebtmapJsonInput, ValidationResult};
+use crate::io::write_json_pretty;
 use anyhow::{Context, Result};
 use std::fs;
 use std::path::Path;
 
-// =============================================================================
-// Environment I/O
-// =============================================================================
-
-/// I/O: Read automation mode from environment variables
-pub fn read_automation_mode() -> bool {
-    std::env::var("PRODIGY_AUTOMATION")
-        .unwrap_or_default()
-        .eq_ignore_ascii_case("true")
-        || std::env::var("PRODIGY_VALIDATION")
-            .unwrap_or_default()
-            .eq_ignore_ascii_case("true")
-}
-
 // =============================================================================
 // File I/O
 // =============================================================================
 
 /// I/O: Load both debtmap files
+///
+/// The two files are independent, so they are read and parsed concurrently.
+/// A failure loading `before` is still reported ahead of one for `after`.
 pub fn load_both_debtmaps(config: &CompareConfig) -> Result<(DebtmapJsonInput, DebtmapJsonInput)> {
-    let before = load_debtmap(&config.before_path)?;
-    let after = load_debtmap(&config.after_path)?;
-    Ok((before, after))
+    let (before, after) = rayon::join(
+        || load_debtmap(&config.before_path),
+        || load_debtmap(&config.after_path),
+    );
+    Ok((before?, after?))
 }
 
 /// I/O: Load single debtmap file
+///
+/// Parses straight from the raw bytes; serde_json validates UTF-8 as it
+/// scans, so there is no separate validation pass over the whole file.
 pub fn load_debtmap(path: &Path) -> Result<DebtmapJsonInput> {
-    let content = fs::read_to_string(path)
+    let content = fs::read(path)
         .with_context(|| format!("Failed to read debtmap file: {}", path.display()))?;
 
-    serde_json::from_str(&content)
+    serde_json::from_slice(&content)
         .with_context(|| format!("Failed to parse debtmap JSON from: {}", path.display()))
 }
 
@@ -49,11 +44,8 @@ pub fn write_validation_result(path: &Path, result: &ValidationResult) -> Result
             .with_context(|| format!("Failed to create directory: {}", parent.display()))?;
     }
 
-    let json = serde_json::to_string_pretty(result)?;
-    fs::write(path, json)
-        .with_context(|| format!("Failed to write validation result to: {}", path.display()))?;
-
-    Ok(())
+    write_json_pretty(path, result)
+        .with_context(|| format!("Failed to write validation result to: {}", path.display()))
 }
 
 // =============================================================================
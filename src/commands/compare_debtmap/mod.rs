@@ -29,9 +29,10 @@ pub mod types;
 // Re-export public types
 pub use types::{AnalysisSummary, CompareConfig, DebtmapJsonInput, GapDetail, ValidationResult};
 
+use crate::cli::is_automation_mode;
 use analysis::{create_summary, identify_all_changes};
 use anyhow::Result;
-use io::{load_both_debtmaps, print_summary, read_automation_mode, write_validation_result};
+use io::{load_both_debtmaps, print_summary, write_validation_result};
 use messages::{build_all_gaps, build_all_improvement_messages, build_all_issue_messages};
 use scoring::{calculate_improvement_score, determine_status};
 use types::DebtmapJsonInput as Input;
@@ -42,7 +43,7 @@ use types::DebtmapJsonInput as Input;
 
 /// I/O Shell: Main entry point - orchestrates I/O and delegates to pure validation
 pub fn compare_debtmaps(config: CompareConfig) -> Result<()> {
-    let is_automation = read_automation_mode();
+    let is_automation = is_automation_mode();
 
     if !is_automation {
         println!("Loading debtmap data from before and after states...");
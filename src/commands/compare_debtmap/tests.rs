@@ -21,7 +21,7 @@ use crate::output::unified::{
 };
 use crate::priority::semantic_classifier::FunctionRole;
 use crate::priority::{DebtType, ImpactMetrics};
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 
 // =============================================================================
 // Test Helper Functions
@@ -685,8 +685,19 @@ fn test_build_function_map_only_functions() {
     let result = build_function_map(&items);
 
     assert_eq!(result.len(), 2);
-    assert!(result.contains_key(&(PathBuf::from("src/foo.rs"), "func1".to_string())));
-    assert!(result.contains_key(&(PathBuf::from("src/bar.rs"), "func2".to_string())));
+    assert!(result.contains_key(&(Path::new("src/foo.rs"), "func1")));
+    assert!(result.contains_key(&(Path::new("src/bar.rs"), "func2")));
+}
+
+#[test]
+fn test_build_function_map_matches_paths_by_component() {
+    let items = vec![create_test_debt_item("src/foo.rs", "func1", 10, 9.0)];
+
+    let result = build_function_map(&items);
+
+    assert!(result.contains_key(&(Path::new("src//foo.rs"), "func1")));
+    assert!(result.contains_key(&(Path::new("src/./foo.rs"), "func1")));
+    assert!(!result.contains_key(&(Path::new("src/bar.rs"), "func1")));
 }
 
 // =============================================================================
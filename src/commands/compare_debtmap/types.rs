@@ -7,7 +7,7 @@ use crate::output::unified::UnifiedDebtItemOutput;
 use crate::priority::ImpactMetrics;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 
 /// Internal type for parsing debtmap JSON files during comparison.
 /// This supports parsing the unified JSON format produced by `debtmap analyze`.
@@ -144,33 +144,26 @@ pub fn extract_functions(
     })
 }
 
-/// Extract function items with their keys (file, function) for lookup operations.
-pub fn extract_function_keys(
-    items: &[UnifiedDebtItemOutput],
-) -> impl Iterator<Item = ((PathBuf, String), &FunctionDebtItemOutput)> {
-    items.iter().filter_map(|item| match item {
-        UnifiedDebtItemOutput::Function(f) => {
-            let key = (
-                PathBuf::from(&f.location.file),
-                f.location.function.clone().unwrap_or_default(),
-            );
-            Some((key, f.as_ref()))
-        }
-        UnifiedDebtItemOutput::File(_) => None,
-    })
+/// Borrowed (file, function) key used to match function items across debtmaps.
+///
+/// Keys borrow from the parsed items, so building lookup maps does not
+/// allocate a path and a function name for every item. The file stays a
+/// `Path` so it matches by components, e.g. `src//a.rs` equals `src/a.rs`.
+pub type FunctionKey<'a> = (&'a Path, &'a str);
+
+/// Build the lookup key for a single function item.
+pub fn function_key(item: &FunctionDebtItemOutput) -> FunctionKey<'_> {
+    (
+        Path::new(&item.location.file),
+        item.location.function.as_deref().unwrap_or_default(),
+    )
 }
 
-/// Extract just the location keys from function items.
-pub fn extract_location_keys(
+/// Extract function items with their keys (file, function) for lookup operations.
+pub fn extract_function_keys(
     items: &[UnifiedDebtItemOutput],
-) -> impl Iterator<Item = (PathBuf, String)> + '_ {
-    items.iter().filter_map(|item| match item {
-        UnifiedDebtItemOutput::Function(f) => Some((
-            PathBuf::from(&f.location.file),
-            f.location.function.clone().unwrap_or_default(),
-        )),
-        UnifiedDebtItemOutput::File(_) => None,
-    })
+) -> impl Iterator<Item = (FunctionKey<'_>, &FunctionDebtItemOutput)> {
+    extract_functions(items).map(|f| (function_key(f), f))
 }
 
 // =============================================================================
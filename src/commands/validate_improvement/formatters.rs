@@ -3,30 +3,22 @@
 //! This module contains pure string-building functions with no I/O.
 //! Each formatter takes a ValidationResult and returns a formatted string.
 
-use anyhow::{Context, Result};
+use std::fmt::Write;
 
 use super::types::ValidationResult;
 
-/// Pure: Format validation result as JSON.
-pub fn format_json(result: &ValidationResult) -> Result<String> {
-    serde_json::to_string_pretty(result).context("Failed to serialize validation result")
-}
-
 /// Pure: Format validation result for terminal display.
 pub fn format_terminal(result: &ValidationResult) -> String {
     let mut output = String::new();
 
     output.push_str("═══ Validation Results ═══\n");
-    output.push_str(&format!(
-        "Completion: {:.1}%\n",
-        result.completion_percentage
-    ));
-    output.push_str(&format!("Status: {}\n\n", result.status));
+    writeln!(output, "Completion: {:.1}%", result.completion_percentage).unwrap();
+    writeln!(output, "Status: {}\n", result.status).unwrap();
 
     if !result.improvements.is_empty() {
         output.push_str("✓ Improvements:\n");
         for improvement in &result.improvements {
-            output.push_str(&format!("  • {}\n", improvement));
+            writeln!(output, "  • {}", improvement).unwrap();
         }
         output.push('\n');
     }
@@ -34,7 +26,7 @@ pub fn format_terminal(result: &ValidationResult) -> String {
     if !result.remaining_issues.is_empty() {
         output.push_str("⚠ Remaining Issues:\n");
         for issue in &result.remaining_issues {
-            output.push_str(&format!("  • {}\n", issue));
+            writeln!(output, "  • {}", issue).unwrap();
         }
     }
 
@@ -46,16 +38,18 @@ pub fn format_markdown(result: &ValidationResult) -> String {
     let mut output = String::new();
 
     output.push_str("# Validation Results\n\n");
-    output.push_str(&format!(
-        "**Completion**: {:.1}%\n",
+    writeln!(
+        output,
+        "**Completion**: {:.1}%",
         result.completion_percentage
-    ));
-    output.push_str(&format!("**Status**: {}\n\n", result.status));
+    )
+    .unwrap();
+    writeln!(output, "**Status**: {}\n", result.status).unwrap();
 
     if !result.improvements.is_empty() {
         output.push_str("## Improvements\n\n");
         for improvement in &result.improvements {
-            output.push_str(&format!("- {}\n", improvement));
+            writeln!(output, "- {}", improvement).unwrap();
         }
         output.push('\n');
     }
@@ -63,7 +57,7 @@ pub fn format_markdown(result: &ValidationResult) -> String {
     if !result.remaining_issues.is_empty() {
         output.push_str("## Remaining Issues\n\n");
         for issue in &result.remaining_issues {
-            output.push_str(&format!("- {}\n", issue));
+            writeln!(output, "- {}", issue).unwrap();
         }
         output.push('\n');
     }
@@ -71,11 +65,11 @@ pub fn format_markdown(result: &ValidationResult) -> String {
     if !result.gaps.is_empty() {
         output.push_str("## Gaps\n\n");
         for (key, gap) in &result.gaps {
-            output.push_str(&format!("### {}\n\n", key));
-            output.push_str(&format!("- **Description**: {}\n", gap.description));
-            output.push_str(&format!("- **Location**: {}\n", gap.location));
-            output.push_str(&format!("- **Severity**: {}\n", gap.severity));
-            output.push_str(&format!("- **Suggested Fix**: {}\n\n", gap.suggested_fix));
+            writeln!(output, "### {}\n", key).unwrap();
+            writeln!(output, "- **Description**: {}", gap.description).unwrap();
+            writeln!(output, "- **Location**: {}", gap.location).unwrap();
+            writeln!(output, "- **Severity**: {}", gap.severity).unwrap();
+            writeln!(output, "- **Suggested Fix**: {}\n", gap.suggested_fix).unwrap();
         }
     }
 
@@ -132,16 +126,6 @@ mod tests {
         assert!(output.contains("**Completion**: 75.0%"));
     }
 
-    #[test]
-    fn test_format_json_parses_back() {
-        let result = create_test_result();
-        let json = format_json(&result).unwrap();
-        let parsed: ValidationResult = serde_json::from_str(&json).unwrap();
-
-        assert_eq!(parsed.completion_percentage, 75.0);
-        assert_eq!(parsed.status, "complete");
-    }
-
     #[test]
     fn test_format_markdown_includes_gaps() {
         let mut result = create_test_result();
@@ -1,10 +1,25 @@
 use anyhow::Result;
+use std::borrow::Cow;
 use std::collections::{HashMap, HashSet};
 
-use crate::comparison::location_matcher::LocationMatcher;
+use crate::comparison::location_matcher::{LocationMatcher, normalize_path};
 use crate::comparison::types::*;
 use crate::priority::{UnifiedAnalysis, UnifiedDebtItem};
 
+/// Identity of a debt item across analyses: normalized file, function, line.
+///
+/// Borrowed from the item so hashing needs no formatted string; the
+/// `file:function:line` form is only built for items that are reported.
+type ItemKey<'a> = (Cow<'a, str>, &'a str, usize);
+
+/// Debt item with its key and score extracted once, up front, so later
+/// passes over the item read plain fields instead of re-deriving them.
+struct KeyedItem<'a> {
+    key: ItemKey<'a>,
+    score: f64,
+    item: &'a UnifiedDebtItem,
+}
+
 pub struct Comparator {
     before: UnifiedAnalysis,
     after: UnifiedAnalysis,
@@ -33,8 +48,10 @@ impl Comparator {
             .transpose()?;
 
         let project_health = self.compare_project_health();
-        let regressions = self.find_regressions();
-        let improvements = self.find_improvements();
+        let before_items = self.keyed_items(&self.before);
+        let after_items = self.keyed_items(&self.after);
+        let regressions = self.find_regressions(&before_items, &after_items);
+        let improvements = self.find_improvements(&before_items, &after_items);
         let summary = self.generate_summary(&target_item, &regressions, &improvements);
 
         Ok(ComparisonResult {
@@ -63,37 +80,33 @@ impl Comparator {
             Err(_) => (None, None, None),
         };
 
-        let status = match (&before_result, &after_result) {
-            (Err(_), _) => TargetStatus::NotFoundBefore,
-            (Ok(_), Err(_)) => TargetStatus::Resolved,
-            (Ok(before), Ok(after)) => {
-                self.classify_target_status_multi(&before.items, &after.items)
-            }
-        };
-
-        let (before_metrics, after_metrics, improvements) = match (&before_result, &after_result) {
-            (Ok(before), Ok(after)) => {
-                let before_m = self.aggregate_metrics(&before.items);
-                let after_m = self.aggregate_metrics(&after.items);
-                let improvements = self.calculate_improvements(&before_m, &after_m);
-                (before_m, Some(after_m), improvements)
-            }
-            (Ok(before), Err(_)) => {
-                let before_m = self.aggregate_metrics(&before.items);
-                let improvements = ImprovementMetrics {
-                    score_reduction_pct: 100.0,
-                    complexity_reduction_pct: 100.0,
-                    coverage_improvement_pct: 100.0,
-                };
-                (before_m, None, improvements)
-            }
-            (Err(_), _) => {
-                return Err(anyhow::anyhow!(
-                    "Target item not found in before analysis at location: {}",
-                    location
-                ));
-            }
-        };
+        // The target status is judged on the same score totals the metrics
+        // report, so the matched items are only summed once per side.
+        let (before_metrics, after_metrics, improvements, status) =
+            match (&before_result, &after_result) {
+                (Ok(before), Ok(after)) => {
+                    let before_m = self.aggregate_metrics(&before.items);
+                    let after_m = self.aggregate_metrics(&after.items);
+                    let improvements = self.calculate_improvements(&before_m, &after_m);
+                    let status = classify_target_status(before_m.score, after_m.score);
+                    (before_m, Some(after_m), improvements, status)
+                }
+                (Ok(before), Err(_)) => {
+                    let before_m = self.aggregate_metrics(&before.items);
+                    let improvements = ImprovementMetrics {
+                        score_reduction_pct: 100.0,
+                        complexity_reduction_pct: 100.0,
+                        coverage_improvement_pct: 100.0,
+                    };
+                    (before_m, None, improvements, TargetStatus::Resolved)
+                }
+                (Err(_), _) => {
+                    return Err(anyhow::anyhow!(
+                        "Target item not found in before analysis at location: {}",
+                        location
+                    ));
+                }
+            };
 
         Ok(TargetComparison {
             location: location.to_string(),
@@ -107,87 +120,85 @@ impl Comparator {
         })
     }
 
-    /// Find regressions (new critical items)
-    fn find_regressions(&self) -> Vec<RegressionItem> {
-        let before_critical: HashSet<String> = self
-            .before
+    /// Pair each item in an analysis with its key and score
+    fn keyed_items<'a>(&self, analysis: &'a UnifiedAnalysis) -> Vec<KeyedItem<'a>> {
+        analysis
             .items
             .iter()
-            .filter(|item| self.get_score(item) >= 60.0)
-            .map(|item| self.item_key(item))
-            .collect();
+            .map(|item| KeyedItem {
+                key: self.item_key(item),
+                score: self.get_score(item),
+                item,
+            })
+            .collect()
+    }
 
-        let after_critical: Vec<&UnifiedDebtItem> = self
-            .after
-            .items
+    /// Find regressions (new critical items)
+    fn find_regressions(&self, before: &[KeyedItem], after: &[KeyedItem]) -> Vec<RegressionItem> {
+        let mut after_critical = after.iter().filter(|keyed| keyed.score >= 60.0).peekable();
+
+        // No critical items after means no regressions; skip keying the before side
+        if after_critical.peek().is_none() {
+            return Vec::new();
+        }
+
+        let before_critical: HashSet<&ItemKey<'_>> = before
             .iter()
-            .filter(|item| self.get_score(item) >= 60.0)
+            .filter(|keyed| keyed.score >= 60.0)
+            .map(|keyed| &keyed.key)
             .collect();
 
         after_critical
-            .iter()
-            .filter(|item| !before_critical.contains(&self.item_key(item)))
-            .map(|item| self.build_regression_item(item))
+            .filter(|keyed| !before_critical.contains(&keyed.key))
+            .map(|keyed| self.build_regression_item(keyed.item))
             .collect()
     }
 
     /// Find improvements (resolved or significantly improved items)
-    fn find_improvements(&self) -> Vec<ImprovementItem> {
-        let before_items: HashMap<String, &UnifiedDebtItem> = self
-            .before
-            .items
-            .iter()
-            .map(|item| (self.item_key(item), item))
-            .collect();
+    fn find_improvements(&self, before: &[KeyedItem], after: &[KeyedItem]) -> Vec<ImprovementItem> {
+        if before.is_empty() {
+            return Vec::new();
+        }
 
-        let after_keys: HashSet<String> = self
-            .after
-            .items
-            .iter()
-            .map(|item| self.item_key(item))
-            .collect();
+        let before_items: HashMap<&ItemKey<'_>, &KeyedItem> =
+            before.iter().map(|keyed| (&keyed.key, keyed)).collect();
+
+        // Keep the first after item per key, as a linear search would
+        let mut after_items: HashMap<&ItemKey<'_>, &KeyedItem> =
+            HashMap::with_capacity(after.len());
+        for keyed in after {
+            after_items.entry(&keyed.key).or_insert(keyed);
+        }
 
-        let mut improvements = Vec::new();
+        // One pass over the before keys classifies each as resolved or
+        // improved; resolved items are still listed ahead of improved ones
+        let mut resolved = Vec::new();
+        let mut reduced = Vec::new();
 
-        // Find resolved items
         for (key, before_item) in before_items.iter() {
-            if !after_keys.contains(key) && self.get_score(before_item) >= 40.0 {
-                improvements.push(ImprovementItem {
-                    location: self.format_location(before_item),
-                    before_score: self.get_score(before_item),
+            match after_items.get(key) {
+                None if before_item.score >= 40.0 => resolved.push(ImprovementItem {
+                    location: self.format_location(before_item.item),
+                    before_score: before_item.score,
                     after_score: None,
                     improvement_type: ImprovementType::Resolved,
-                });
-            }
-        }
-
-        // Find significantly improved items (>30% reduction)
-        for before_item in before_items.values() {
-            let key = self.item_key(before_item);
-            if let Some(after_item) = self
-                .after
-                .items
-                .iter()
-                .find(|item| self.item_key(item) == key)
-            {
-                let before_score = self.get_score(before_item);
-                let after_score = self.get_score(after_item);
-
-                if before_score > 0.0 {
-                    let reduction = (before_score - after_score) / before_score * 100.0;
-                    if reduction >= 30.0 {
-                        improvements.push(ImprovementItem {
-                            location: self.format_location(before_item),
-                            before_score,
-                            after_score: Some(after_score),
-                            improvement_type: ImprovementType::ScoreReduced,
-                        });
-                    }
+                }),
+                Some(after_item)
+                    if is_significant_reduction(before_item.score, after_item.score) =>
+                {
+                    reduced.push(ImprovementItem {
+                        location: self.format_location(before_item.item),
+                        before_score: before_item.score,
+                        after_score: Some(after_item.score),
+                        improvement_type: ImprovementType::ScoreReduced,
+                    })
                 }
+                _ => {}
             }
         }
 
-        improvements
+        resolved.append(&mut reduced);
+        resolved
     }
 
     /// Compare project-wide health metrics
@@ -222,60 +233,42 @@ impl Comparator {
             return self.extract_metrics(items[0]);
         }
 
-        // For multiple items, sum scores and average complexities
-        let total_score: f64 = items.iter().map(|i| self.get_score(i)).sum();
-
-        let total_cyclomatic: u32 = items.iter().map(|i| i.cyclomatic_complexity).sum();
-        let total_cognitive: u32 = items.iter().map(|i| i.cognitive_complexity).sum();
-
-        let avg_coverage = items
-            .iter()
-            .filter_map(|i| i.transitive_coverage.as_ref())
-            .map(|tc| tc.transitive)
-            .sum::<f64>()
-            / items.len() as f64;
-
-        let total_length: usize = items.iter().map(|i| i.function_length).sum();
-        let max_nesting = items.iter().map(|i| i.nesting_depth).max().unwrap_or(0);
+        // For multiple items, sum scores and complexities in a single pass
+        let totals = items.iter().fold(
+            TargetMetrics {
+                score: 0.0,
+                cyclomatic_complexity: 0,
+                cognitive_complexity: 0,
+                coverage: 0.0,
+                function_length: 0,
+                nesting_depth: 0,
+            },
+            |acc, item| TargetMetrics {
+                score: acc.score + self.get_score(item),
+                cyclomatic_complexity: acc.cyclomatic_complexity + item.cyclomatic_complexity,
+                cognitive_complexity: acc.cognitive_complexity + item.cognitive_complexity,
+                coverage: acc.coverage
+                    + item
+                        .transitive_coverage
+                        .as_ref()
+                        .map(|tc| tc.transitive)
+                        .unwrap_or(0.0),
+                function_length: acc.function_length + item.function_length,
+                nesting_depth: acc.nesting_depth.max(item.nesting_depth),
+            },
+        );
 
         TargetMetrics {
-            score: total_score,
-            cyclomatic_complexity: total_cyclomatic,
-            cognitive_complexity: total_cognitive,
-            coverage: avg_coverage,
-            function_length: total_length,
-            nesting_depth: max_nesting,
+            coverage: totals.coverage / items.len() as f64,
+            ..totals
         }
     }
 
-    /// Classify status for multiple items
-    fn classify_target_status_multi(
-        &self,
-        before_items: &[&UnifiedDebtItem],
-        after_items: &[&UnifiedDebtItem],
-    ) -> TargetStatus {
-        let before_score: f64 = before_items.iter().map(|i| self.get_score(i)).sum();
-        let after_score: f64 = after_items.iter().map(|i| self.get_score(i)).sum();
-
-        if before_score == 0.0 {
-            return TargetStatus::Unchanged;
-        }
-
-        if after_score < before_score * 0.7 {
-            TargetStatus::Improved
-        } else if after_score > before_score * 1.1 {
-            TargetStatus::Regressed
-        } else {
-            TargetStatus::Unchanged
-        }
-    }
-
-    fn item_key(&self, item: &UnifiedDebtItem) -> String {
-        let file_str = item.location.file.to_string_lossy();
-        let normalized_file = file_str.strip_prefix("./").unwrap_or(&file_str);
-        format!(
-            "{}:{}:{}",
-            normalized_file, item.location.function, item.location.line
+    fn item_key<'a>(&self, item: &'a UnifiedDebtItem) -> ItemKey<'a> {
+        (
+            normalize_path(&item.location.file),
+            item.location.function.as_str(),
+            item.location.line,
         )
     }
 
@@ -284,7 +277,8 @@ impl Comparator {
     }
 
     fn format_location(&self, item: &UnifiedDebtItem) -> String {
-        self.item_key(item)
+        let (file, function, line) = self.item_key(item);
+        format!("{}:{}:{}", file, function, line)
     }
 
     fn extract_metrics(&self, item: &UnifiedDebtItem) -> TargetMetrics {
@@ -335,24 +329,23 @@ impl Comparator {
 
     fn extract_project_metrics(&self, analysis: &UnifiedAnalysis) -> ProjectMetrics {
         let total_items = analysis.items.len();
-        let critical_items = analysis
-            .items
-            .iter()
-            .filter(|item| self.get_score(item) >= 60.0)
-            .count();
-        let high_priority_items = analysis
-            .items
-            .iter()
-            .filter(|item| self.get_score(item) >= 40.0)
-            .count();
 
-        let average_score = if total_items > 0 {
+        // Single pass: bucket counts and score sum are rolled up together
+        let (critical_items, high_priority_items, score_sum) =
             analysis
                 .items
                 .iter()
-                .map(|item| self.get_score(item))
-                .sum::<f64>()
-                / total_items as f64
+                .fold((0usize, 0usize, 0.0f64), |(critical, high, sum), item| {
+                    let score = self.get_score(item);
+                    (
+                        critical + usize::from(score >= 60.0),
+                        high + usize::from(score >= 40.0),
+                        sum + score,
+                    )
+                });
+
+        let average_score = if total_items > 0 {
+            score_sum / total_items as f64
         } else {
             0.0
         };
@@ -439,6 +432,24 @@ impl Comparator {
     }
 }
 
+/// Check whether a score dropped by at least 30%.
+fn is_significant_reduction(before_score: f64, after_score: f64) -> bool {
+    before_score > 0.0 && (before_score - after_score) / before_score * 100.0 >= 30.0
+}
+
+/// Classify a target from its summed before and after scores
+fn classify_target_status(before_score: f64, after_score: f64) -> TargetStatus {
+    if before_score == 0.0 {
+        TargetStatus::Unchanged
+    } else if after_score < before_score * 0.7 {
+        TargetStatus::Improved
+    } else if after_score > before_score * 1.1 {
+        TargetStatus::Regressed
+    } else {
+        TargetStatus::Unchanged
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -669,4 +680,15 @@ mod tests {
         let target = result.unwrap().target_item.unwrap();
         assert_eq!(target.improvements.complexity_reduction_pct, 0.0);
     }
+
+    #[test]
+    fn test_is_significant_reduction() {
+        assert!(is_significant_reduction(100.0, 70.0));
+        assert!(is_significant_reduction(81.9, 15.2));
+        assert!(!is_significant_reduction(100.0, 71.0));
+        assert!(!is_significant_reduction(0.0, 0.0));
+        assert!(is_significant_reduction(3.0, 2.1));
+        assert!(is_significant_reduction(12.0, 8.4));
+        assert!(is_significant_reduction(1.5, 1.05));
+    }
 }
@@ -1,4 +1,5 @@
 use anyhow::Result;
+use std::borrow::Cow;
 
 use crate::priority::{UnifiedAnalysis, UnifiedDebtItem};
 
@@ -140,13 +141,12 @@ impl LocationMatcher {
             _ => return None,
         };
 
-        let item = analysis.items.iter().find(|item| {
-            let item_file = normalize_path(&item.location.file);
-            let target_file = normalize_path_str(file);
+        let target_file = normalize_path_str(file);
 
-            item_file == target_file
+        let item = analysis.items.iter().find(|item| {
+            item.location.line == line
                 && item.location.function == *function
-                && item.location.line == line
+                && normalize_path(&item.location.file) == target_file
         })?;
 
         Some(MatchResult {
@@ -168,14 +168,14 @@ impl LocationMatcher {
             _ => return None,
         };
 
+        let target_file = normalize_path_str(file);
+
         let items: Vec<&UnifiedDebtItem> = analysis
             .items
             .iter()
             .filter(|item| {
-                let item_file = normalize_path(&item.location.file);
-                let target_file = normalize_path_str(file);
-
-                item_file == target_file && item.location.function == *function
+                item.location.function == *function
+                    && normalize_path(&item.location.file) == target_file
             })
             .collect();
 
@@ -285,14 +285,19 @@ impl Default for LocationMatcher {
 }
 
 /// Normalize a path for comparison
-fn normalize_path(path: &std::path::Path) -> String {
-    let path_str = path.to_string_lossy();
-    normalize_path_str(&path_str)
+///
+/// Borrows from the path whenever it is valid UTF-8, so matching against
+/// every item in an analysis does not allocate a string per item.
+pub(super) fn normalize_path(path: &std::path::Path) -> Cow<'_, str> {
+    match path.to_string_lossy() {
+        Cow::Borrowed(path_str) => Cow::Borrowed(normalize_path_str(path_str)),
+        Cow::Owned(path_str) => Cow::Owned(normalize_path_str(&path_str).to_string()),
+    }
 }
 
 /// Normalize a path string for comparison
-fn normalize_path_str(path: &str) -> String {
-    path.strip_prefix("./").unwrap_or(path).to_string()
+fn normalize_path_str(path: &str) -> &str {
+    path.strip_prefix("./").unwrap_or(path)
 }
 
 /// Calculate similarity between two strings (simple prefix-based)
@@ -1,9 +1,17 @@
 use crate::core::{DebtItem, DebtType, Priority};
 use crate::debt::suppression::SuppressionContext;
+use once_cell::sync::Lazy;
 use regex::Regex;
 use std::collections::HashMap;
 use std::path::Path;
 
+// Pre-compiled regex patterns for performance
+static TODO_PATTERN: Lazy<Regex> =
+    Lazy::new(|| Regex::new(r"(?i)\b(TODO|FIXME|HACK|XXX|BUG|OPTIMIZE|REFACTOR):\s*(.*)").unwrap());
+
+static STRING_LITERAL_PATTERN: Lazy<Regex> =
+    Lazy::new(|| Regex::new(r#"["']([^"']{20,})["']"#).unwrap());
+
 pub fn find_todos_and_fixmes(content: &str, file: &Path) -> Vec<DebtItem> {
     find_todos_and_fixmes_with_suppression(content, file, None)
 }
@@ -13,14 +21,13 @@ pub fn find_todos_and_fixmes_with_suppression(
     file: &Path,
     suppression: Option<&SuppressionContext>,
 ) -> Vec<DebtItem> {
-    let todo_regex =
-        Regex::new(r"(?i)\b(TODO|FIXME|HACK|XXX|BUG|OPTIMIZE|REFACTOR):\s*(.*)").unwrap();
-
     content
         .lines()
         .enumerate()
+        // Every marker is followed by ':', so lines without one can't match
+        .filter(|(_, line)| line.contains(':'))
         .filter_map(|(line_num, line)| {
-            todo_regex.captures(line).and_then(|captures| {
+            TODO_PATTERN.captures(line).and_then(|captures| {
                 let marker = captures.get(1).unwrap().as_str().to_uppercase();
                 let message = captures.get(2).unwrap().as_str().trim();
 
@@ -171,12 +178,13 @@ pub fn detect_duplicate_strings(content: &str, file: &Path) -> Vec<DebtItem> {
 }
 
 fn extract_string_occurrences(content: &str) -> Vec<(String, usize)> {
-    let string_regex = Regex::new(r#"["']([^"']{20,})["']"#).unwrap();
-
     content
         .lines()
         .enumerate()
-        .flat_map(|(line_num, line)| extract_strings_from_line(&string_regex, line, line_num + 1))
+        .filter(|(_, line)| line.contains(['"', '\'']))
+        .flat_map(|(line_num, line)| {
+            extract_strings_from_line(&STRING_LITERAL_PATTERN, line, line_num + 1)
+        })
         .collect()
 }
 
@@ -260,7 +260,15 @@ enum LineParseResult {
     None,
 }
 
+/// Literal shared by every suppression pattern, used to skip regex matching
+/// on lines (and whole files) that cannot contain a suppression comment.
+const SUPPRESSION_MARKER: &str = "debtmap:ignore";
+
 fn parse_line(line: &str, line_number: usize, patterns: &SuppressionPatterns) -> LineParseResult {
+    if !line.contains(SUPPRESSION_MARKER) {
+        return LineParseResult::None;
+    }
+
     // Try each pattern in order and return the first match
     // Note: function_allow is tried before line suppression to avoid partial matches
     try_parse_block_start(line, line_number, patterns)
@@ -422,6 +430,11 @@ pub fn parse_suppression_comments(
     language: Language,
     file: &Path,
 ) -> SuppressionContext {
+    // Most files have no suppressions; skip compiling the patterns entirely
+    if !content.contains(SUPPRESSION_MARKER) {
+        return SuppressionContext::new();
+    }
+
     let patterns = SuppressionPatterns::new(language);
     let mut context = SuppressionContext::new();
     let mut open_blocks: Vec<(usize, Vec<DebtType>, Option<String>)> = Vec::new();
@@ -609,6 +622,32 @@ mod tests {
         assert!(!context.is_suppressed(4, &DebtType::Fixme { reason: None }));
     }
 
+    #[test]
+    fn test_marker_prefilter_keeps_late_and_mixed_suppressions() {
+        // debtmap:ignore-start -- Test fixture data
+        let content = r#"
+fn main() {}
+// TODO: Not suppressed
+let value = 1;
+// FIXME: Suppressed // debtmap:ignore
+// TODO: Still not suppressed
+// debtmap:ignore-next-line
+// TODO: Suppressed by the line above
+"#;
+        // debtmap:ignore-end
+        let file = PathBuf::from("test.rs");
+        let context = parse_suppression_comments(content, Language::Rust, &file);
+
+        let mut suppressed_lines: Vec<usize> = context.line_suppressions.keys().copied().collect();
+        suppressed_lines.sort_unstable();
+        assert_eq!(suppressed_lines, vec![5, 7]);
+        assert!(context.active_blocks.is_empty());
+        assert!(!context.is_suppressed(3, &DebtType::Todo { reason: None }));
+        assert!(context.is_suppressed(5, &DebtType::Fixme { reason: None }));
+        assert!(!context.is_suppressed(6, &DebtType::Todo { reason: None }));
+        assert!(context.is_suppressed(8, &DebtType::Todo { reason: None }));
+    }
+
     #[test]
     fn test_parse_next_line_suppression() {
         // debtmap:ignore-start -- Test fixture data
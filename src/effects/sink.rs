@@ -45,6 +45,7 @@ use tokio::fs::File;
 use tokio::io::{AsyncWriteExt, BufWriter};
 
 use crate::errors::AnalysisError;
+use crate::io::WRITE_BUFFER_SIZE;
 
 /// Report line types for streaming output.
 ///
@@ -260,7 +261,10 @@ where
         .await
         .map_err(|e| AnalysisError::io(format!("Failed to create output file: {}", e)))?;
 
-    let writer = std::sync::Arc::new(tokio::sync::Mutex::new(BufWriter::new(file)));
+    let writer = std::sync::Arc::new(tokio::sync::Mutex::new(BufWriter::with_capacity(
+        WRITE_BUFFER_SIZE,
+        file,
+    )));
 
     let result = effect
         .run_with_sink(env, |line| {
@@ -113,13 +113,25 @@ pub fn build_summary_rows(
     ]
 }
 
+/// Select the `count` most complex functions, most complex first.
+///
+/// Uses partial selection so only the selected prefix is sorted. Ties keep
+/// their input order, matching a stable sort of the full list.
 pub fn get_top_complex_functions(
     metrics: &[FunctionMetrics],
     count: usize,
 ) -> Vec<&FunctionMetrics> {
-    let mut sorted = metrics.iter().collect::<Vec<_>>();
-    sorted.sort_by_key(|m| std::cmp::Reverse(m.cyclomatic.max(m.cognitive)));
-    sorted.into_iter().take(count).collect()
+    let rank = |&(idx, m): &(usize, &FunctionMetrics)| {
+        (std::cmp::Reverse(m.cyclomatic.max(m.cognitive)), idx)
+    };
+
+    let mut ranked = metrics.iter().enumerate().collect::<Vec<_>>();
+    if count < ranked.len() {
+        ranked.select_nth_unstable_by_key(count, rank);
+        ranked.truncate(count);
+    }
+    ranked.sort_unstable_by_key(rank);
+    ranked.into_iter().map(|(_, m)| m).collect()
 }
 
 pub fn get_recommendation(func: &FunctionMetrics) -> &'static str {
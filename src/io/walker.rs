@@ -1,7 +1,8 @@
 use crate::core::Language;
 use anyhow::Result;
-use ignore::WalkBuilder;
+use ignore::{WalkBuilder, WalkState};
 use std::path::{Path, PathBuf};
+use std::sync::Mutex;
 
 pub struct FileWalker {
     root: PathBuf,
@@ -35,28 +36,49 @@ impl FileWalker {
         self
     }
 
+    /// Walk the tree in parallel and return matching files in sorted order.
+    ///
+    /// Uses as many walker threads as the global rayon pool, so `--jobs`
+    /// bounds the walk the same way it bounds analysis.
     pub fn walk(&self) -> Result<Vec<PathBuf>> {
-        let mut files = Vec::new();
-        let walker = WalkBuilder::new(&self.root)
+        let ignore_patterns = compile_ignore_patterns(&self.ignore_patterns);
+        let files = Mutex::new(Vec::new());
+        let first_error = Mutex::new(None);
+
+        WalkBuilder::new(&self.root)
             .hidden(false)
             .git_ignore(true)
             .require_git(false)
             .filter_entry(|entry| !is_git_metadata(entry.path()))
-            .build();
-
-        for entry in walker {
-            let entry = entry?;
-            let path = entry.path();
+            .threads(rayon::current_num_threads())
+            .build_parallel()
+            .run(|| {
+                Box::new(|entry| match entry {
+                    Ok(entry) => {
+                        let path = entry.path();
+                        if is_regular_file(&entry) && self.should_process(path, &ignore_patterns) {
+                            files.lock().unwrap().push(path.to_path_buf());
+                        }
+                        WalkState::Continue
+                    }
+                    Err(err) => {
+                        first_error.lock().unwrap().get_or_insert(err);
+                        WalkState::Quit
+                    }
+                })
+            });
 
-            if path.is_file() && self.should_process(path) {
-                files.push(path.to_path_buf());
-            }
+        if let Some(err) = first_error.into_inner().unwrap() {
+            return Err(err.into());
         }
 
+        // Worker threads finish in arbitrary order; sort for deterministic output
+        let mut files = files.into_inner().unwrap();
+        files.sort_unstable();
         Ok(files)
     }
 
-    fn should_process(&self, path: &Path) -> bool {
+    fn should_process(&self, path: &Path, ignore_patterns: &[glob::Pattern]) -> bool {
         if let Some(ext) = path.extension() {
             let ext_str = ext.to_string_lossy();
             let lang = Language::from_extension(&ext_str);
@@ -72,22 +94,20 @@ impl FileWalker {
                 .unwrap_or(path)
                 .to_string_lossy();
 
-            for pattern in &self.ignore_patterns {
-                if let Ok(glob_pattern) = glob::Pattern::new(pattern) {
-                    // Check against absolute path
-                    if glob_pattern.matches(&path_str) {
-                        return false;
-                    }
-                    // Check against relative path
-                    if glob_pattern.matches(&relative_path) {
-                        return false;
-                    }
-                    // Check against filename for patterns like "*.test.rs"
-                    if let Some(file_name) = path.file_name()
-                        && glob_pattern.matches(file_name.to_string_lossy().as_ref())
-                    {
-                        return false;
-                    }
+            for glob_pattern in ignore_patterns {
+                // Check against absolute path
+                if glob_pattern.matches(&path_str) {
+                    return false;
+                }
+                // Check against relative path
+                if glob_pattern.matches(&relative_path) {
+                    return false;
+                }
+                // Check against filename for patterns like "*.test.rs"
+                if let Some(file_name) = path.file_name()
+                    && glob_pattern.matches(file_name.to_string_lossy().as_ref())
+                {
+                    return false;
                 }
             }
 
@@ -98,9 +118,26 @@ impl FileWalker {
     }
 }
 
+/// Check file type from the directory entry, which the walker already read
+/// from the directory listing; only symlinks need a `stat` to resolve.
+fn is_regular_file(entry: &ignore::DirEntry) -> bool {
+    entry.file_type().is_some_and(|file_type| {
+        file_type.is_file() || (file_type.is_symlink() && entry.path().is_file())
+    })
+}
+
+/// Compile ignore globs once per walk; invalid patterns are skipped.
+fn compile_ignore_patterns(patterns: &[String]) -> Vec<glob::Pattern> {
+    patterns
+        .iter()
+        .filter_map(|pattern| glob::Pattern::new(pattern).ok())
+        .collect()
+}
+
+/// Used as a `filter_entry` predicate, so a matching `.git` directory is pruned
+/// before the walker descends into it; only the entry's own name needs checking.
 fn is_git_metadata(path: &Path) -> bool {
-    path.components()
-        .any(|component| component.as_os_str() == ".git")
+    path.file_name().is_some_and(|name| name == ".git")
 }
 
 pub fn find_project_files(root: &Path, languages: Vec<Language>) -> Result<Vec<PathBuf>> {
@@ -239,6 +276,26 @@ mod tests {
         assert!(file_names.contains(&"main.go".to_string()));
     }
 
+    #[test]
+    fn test_walk_returns_sorted_paths() {
+        let (_temp_dir, root) = create_test_project();
+
+        let walker = FileWalker::new(root).with_languages(vec![Language::Rust]);
+        let files = walker.walk().unwrap();
+
+        assert!(files.windows(2).all(|pair| pair[0] < pair[1]));
+    }
+
+    #[test]
+    fn test_walk_propagates_errors_for_missing_root() {
+        let temp_dir = TempDir::new().unwrap();
+        let missing = temp_dir.path().join("does-not-exist");
+
+        let walker = FileWalker::new(missing).with_languages(vec![Language::Rust]);
+
+        assert!(walker.walk().is_err());
+    }
+
     #[test]
     fn test_find_files_with_ignore_patterns() {
         let (_temp_dir, root) = create_test_project();
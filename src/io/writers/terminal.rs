@@ -1,7 +1,7 @@
 use crate::core::{AnalysisResults, FunctionMetrics, Priority};
 use crate::debt::total_debt_score;
 use crate::formatting::{ColoredFormatter, FormattingConfig};
-use crate::io::output::OutputWriter;
+use crate::io::output::{OutputWriter, get_top_complex_functions};
 use crate::io::writers::pattern_display::extract_pattern_info;
 use crate::refactoring::ComplexityLevel;
 use crate::risk::{RiskDistribution, RiskInsight};
@@ -332,12 +332,6 @@ fn print_complexity_hotspots(results: &AnalysisResults) {
     }
 }
 
-fn get_top_complex_functions(metrics: &[FunctionMetrics], count: usize) -> Vec<&FunctionMetrics> {
-    let mut sorted = metrics.iter().collect::<Vec<_>>();
-    sorted.sort_by_key(|m| std::cmp::Reverse(m.cyclomatic.max(m.cognitive)));
-    sorted.into_iter().take(count).collect()
-}
-
 fn print_technical_debt(results: &AnalysisResults) {
     if results.technical_debt.items.is_empty() {
         return;
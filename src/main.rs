@@ -16,6 +16,7 @@ use debtmap::cli::{
 };
 use debtmap::di::create_app_container;
 use debtmap::observability::{extract_thread_panic_message, init_tracing, install_panic_hook};
+use std::ffi::OsString;
 use std::sync::Arc;
 
 /// Extract the number of jobs from a command, defaulting to 0 for commands that don't support it.
@@ -26,22 +27,31 @@ fn extract_jobs(command: &Commands) -> usize {
     }
 }
 
+/// Pure logic: choose the argument tokens to hand to clap.
+///
+/// A set, non-blank ARGUMENTS value replaces everything after the program
+/// name; unset or blank values fall through to the process arguments instead
+/// of failing to parse an empty command line.
+fn resolve_cli_args(arguments: Option<String>, argv: Vec<OsString>) -> Vec<OsString> {
+    match arguments {
+        Some(args_str) if !args_str.trim().is_empty() => {
+            let program = argv.into_iter().next().unwrap_or_else(|| "debtmap".into());
+            std::iter::once(program)
+                .chain(args_str.split_whitespace().map(Into::into))
+                .collect()
+        }
+        _ => argv,
+    }
+}
+
 /// Parse CLI arguments, supporting ARGUMENTS environment variable for backward compatibility.
 ///
-/// This is a pure function that encapsulates the CLI parsing logic.
+/// Thin I/O shell that reads the environment and delegates to `resolve_cli_args`.
 fn parse_cli() -> Cli {
-    if let Ok(args_str) = std::env::var("ARGUMENTS") {
-        let args: Vec<String> = args_str.split_whitespace().map(String::from).collect();
-        let mut full_args = vec![
-            std::env::args()
-                .next()
-                .unwrap_or_else(|| "debtmap".to_string()),
-        ];
-        full_args.extend(args);
-        Cli::parse_from(full_args)
-    } else {
-        Cli::parse()
-    }
+    Cli::parse_from(resolve_cli_args(
+        std::env::var("ARGUMENTS").ok(),
+        std::env::args_os().collect(),
+    ))
 }
 
 fn main() -> Result<()> {
@@ -147,6 +157,42 @@ mod tests {
         Cli::parse_from(full_args).command
     }
 
+    fn os_args(args: &[&str]) -> Vec<OsString> {
+        args.iter().map(OsString::from).collect()
+    }
+
+    #[test]
+    fn test_resolve_cli_args_unset_uses_argv() {
+        let argv = os_args(&["debtmap", "analyze", "."]);
+        assert_eq!(resolve_cli_args(None, argv.clone()), argv);
+    }
+
+    #[test]
+    fn test_resolve_cli_args_blank_uses_argv() {
+        let argv = os_args(&["debtmap", "analyze", "."]);
+        assert_eq!(resolve_cli_args(Some(String::new()), argv.clone()), argv);
+        assert_eq!(
+            resolve_cli_args(Some(" \t\n ".to_string()), argv.clone()),
+            argv
+        );
+    }
+
+    #[test]
+    fn test_resolve_cli_args_populated_replaces_argv() {
+        let argv = os_args(&["/usr/bin/debtmap", "ignored"]);
+        let resolved = resolve_cli_args(Some("analyze .  --jobs 8".to_string()), argv);
+        assert_eq!(
+            resolved,
+            os_args(&["/usr/bin/debtmap", "analyze", ".", "--jobs", "8"])
+        );
+    }
+
+    #[test]
+    fn test_resolve_cli_args_populated_without_program_name() {
+        let resolved = resolve_cli_args(Some("init".to_string()), Vec::new());
+        assert_eq!(resolved, os_args(&["debtmap", "init"]));
+    }
+
     #[test]
     fn test_extract_jobs_from_analyze_command_default() {
         let cmd = parse_command(&["analyze", "."]);
@@ -2,9 +2,11 @@
 //!
 //! Provides DOT/Graphviz format output for file dependency visualization.
 
+use crate::io::create_buffered_file;
 use crate::io::writers::{DotConfig, DotWriter, RankDir};
 use crate::priority::UnifiedAnalysis;
 use anyhow::Result;
+use std::io::Write;
 use std::path::PathBuf;
 
 /// Output unified analysis in DOT format
@@ -22,9 +24,9 @@ pub fn output_dot(
 
     match output_file {
         Some(path) => {
-            let file = std::fs::File::create(&path)?;
-            let mut buf_writer = std::io::BufWriter::new(file);
+            let mut buf_writer = create_buffered_file(&path)?;
             writer.write(analysis, &mut buf_writer)?;
+            buf_writer.flush()?;
         }
         None => {
             let stdout = std::io::stdout();
@@ -1,10 +1,10 @@
+use crate::io::{buffered_stdout, write_json_pretty};
 use crate::priority;
 #[cfg(test)]
 use crate::priority::UnifiedAnalysisUtils;
 use anyhow::Result;
 use std::cmp::Ordering;
 use std::collections::HashSet;
-use std::fs;
 use std::io::Write;
 use std::path::PathBuf;
 
@@ -37,16 +37,17 @@ pub fn output_json_with_format(
 
     // Apply filtering to unified output
     let filtered = apply_filters_to_unified_output(unified_output, top, tail);
-    let json = serde_json::to_string_pretty(&filtered)?;
 
     if let Some(path) = output_file {
         if let Some(parent) = path.parent() {
             crate::io::ensure_dir(parent)?;
         }
-        let mut file = fs::File::create(path)?;
-        file.write_all(json.as_bytes())?;
+        write_json_pretty(&path, &filtered)?;
     } else {
-        println!("{json}");
+        let mut writer = buffered_stdout();
+        serde_json::to_writer_pretty(&mut writer, &filtered)?;
+        writeln!(writer)?;
+        writer.flush()?;
     }
     Ok(())
 }
@@ -174,6 +175,7 @@ mod tests {
         ActionableRecommendation, DebtType, FunctionRole, ImpactMetrics, Location, UnifiedDebtItem,
         UnifiedScore, call_graph::CallGraph,
     };
+    use std::fs;
     use std::path::PathBuf;
     use tempfile::TempDir;
 
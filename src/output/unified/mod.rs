@@ -120,13 +120,24 @@ fn sort_by_score_descending(mut items: Vec<UnifiedDebtItemOutput>) -> Vec<Unifie
     items
 }
 
+/// Count one item in its category, cloning the key only the first time the
+/// category is seen rather than for every item (helper for fold)
+fn count_category(counts: &mut HashMap<String, usize>, category: &str) {
+    match counts.get_mut(category) {
+        Some(count) => *count += 1,
+        None => {
+            counts.insert(category.to_owned(), 1);
+        }
+    }
+}
+
 /// Update statistics for a file item (helper for fold)
 fn accumulate_file_stats(
     mut stats: ItemStatistics,
     f: &file_item::FileDebtItemOutput,
 ) -> ItemStatistics {
     stats.file_count += 1;
-    *stats.category_counts.entry(f.category.clone()).or_insert(0) += 1;
+    count_category(&mut stats.category_counts, &f.category);
     match f.priority {
         Priority::Critical => stats.score_distribution.critical += 1,
         Priority::High => stats.score_distribution.high += 1,
@@ -150,7 +161,7 @@ fn accumulate_function_stats(
     f: &func_item::FunctionDebtItemOutput,
 ) -> ItemStatistics {
     stats.function_count += 1;
-    *stats.category_counts.entry(f.category.clone()).or_insert(0) += 1;
+    count_category(&mut stats.category_counts, &f.category);
     match f.priority {
         Priority::Critical => stats.score_distribution.critical += 1,
         Priority::High => stats.score_distribution.high += 1,
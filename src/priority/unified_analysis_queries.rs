@@ -402,14 +402,22 @@ impl TierGroups {
 }
 
 /// Sort groups by total score (descending).
-fn sort_groups_by_score(groups: &mut [DisplayGroup]) {
-    groups.sort_by(|a, b| {
-        let a_score: f64 = a.items.iter().map(|i| i.score()).sum();
-        let b_score: f64 = b.items.iter().map(|i| i.score()).sum();
+///
+/// Each group's total is computed once up front rather than re-summed on
+/// every comparison.
+fn sort_groups_by_score(groups: &mut Vec<DisplayGroup>) {
+    let mut scored: Vec<(f64, DisplayGroup)> = groups
+        .drain(..)
+        .map(|group| (group.items.iter().map(|i| i.score()).sum(), group))
+        .collect();
+
+    scored.sort_by(|(a_score, _), (b_score, _)| {
         b_score
-            .partial_cmp(&a_score)
+            .partial_cmp(a_score)
             .unwrap_or(std::cmp::Ordering::Equal)
     });
+
+    groups.extend(scored.into_iter().map(|(_, group)| group));
 }
 
 /// Create a DisplayGroup for a single critical item.
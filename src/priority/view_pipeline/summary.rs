@@ -20,9 +20,7 @@ pub fn calculate_summary(
     total_loc: usize,
     overall_coverage: Option<f64>,
 ) -> ViewSummary {
-    let total_debt_score: f64 = items.iter().map(|i| i.score()).sum();
-
-    let score_distribution = calculate_score_distribution(items);
+    let (total_debt_score, score_distribution) = calculate_score_totals(items);
     let category_counts = calculate_category_counts(items);
 
     let debt_density = if total_loc > 0 {
@@ -45,12 +43,18 @@ pub fn calculate_summary(
     }
 }
 
-/// Calculates score distribution by severity.
-fn calculate_score_distribution(items: &[ViewItem]) -> ScoreDistribution {
+/// Calculates total score and score distribution by severity.
+///
+/// Reads each item's score once, feeding both the running total and the
+/// severity bucket in the same pass.
+fn calculate_score_totals(items: &[ViewItem]) -> (f64, ScoreDistribution) {
+    let mut total = 0.0;
     let mut dist = ScoreDistribution::default();
 
     for item in items {
-        match item.severity() {
+        let score = item.score();
+        total += score;
+        match Severity::from_score_100(score) {
             Severity::Critical => dist.critical += 1,
             Severity::High => dist.high += 1,
             Severity::Medium => dist.medium += 1,
@@ -58,7 +62,7 @@ fn calculate_score_distribution(items: &[ViewItem]) -> ScoreDistribution {
         }
     }
 
-    dist
+    (total, dist)
 }
 
 /// Calculates category counts.
@@ -131,12 +131,14 @@ fn merge_coverage(coverages: Vec<&FunctionCoverage>) -> AggregateCoverage {
     let mut uncovered_in_all: HashSet<usize> =
         coverages[0].uncovered_lines.iter().copied().collect();
 
+    // Narrow the running set in place instead of collecting a fresh
+    // intersection per version; once it is empty no later version can add to it
     for coverage in &coverages[1..] {
+        if uncovered_in_all.is_empty() {
+            break;
+        }
         let uncovered_set: HashSet<usize> = coverage.uncovered_lines.iter().copied().collect();
-        uncovered_in_all = uncovered_in_all
-            .intersection(&uncovered_set)
-            .copied()
-            .collect();
+        uncovered_in_all.retain(|line| uncovered_set.contains(line));
     }
 
     // Average coverage percentage across all versions (Spec 214 fix)